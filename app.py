@@ -1,30 +1,35 @@
 # main.py
+import time
+_STARTED = time.perf_counter()
+
 import heapq
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, messagebox
-import ttkbootstrap as tb
-from ttkbootstrap.constants import *
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from tkinter.constants import *
+from chart import LazyChart, prefetch_chart_modules
+from gantt_index import GanttIndex
+from metrics import format_summary, metrics_from_schedule
+from mlfq import mlfq as mlfq_schedule, quanta_for
+from process import Process, as_processes, by_arrival, by_burst, by_priority
 
 # ---------------- Scheduling Algorithms ---------------- #
 def fcfs(processes):
-    procs = sorted(processes, key=lambda p: p["arrival"])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     gantt = []
     stats = {}
     for p in procs:
-        start = max(time, p["arrival"])
-        finish = start + p["burst"]
-        gantt.append((p["id"], start, finish))
-        wt = start - p["arrival"]
-        tat = finish - p["arrival"]
-        stats[p["id"]] = {"waiting": wt, "turnaround": tat}
+        arrival = p.arrival
+        start = max(time, arrival)
+        finish = start + p.burst
+        gantt.append((p.id, start, finish))
+        stats[p.id] = {"waiting": start - arrival, "turnaround": finish - arrival}
         time = finish
     return gantt, stats
 
 def sjf_non_preemptive(processes):
-    procs = sorted(processes, key=lambda p: p["arrival"])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     i = 0
     ready = []
@@ -32,38 +37,37 @@ def sjf_non_preemptive(processes):
     stats = {}
     n = len(procs)
     while i < n or ready:
-        while i < n and procs[i]["arrival"] <= time:
+        while i < n and procs[i].arrival <= time:
             ready.append(procs[i])
             i += 1
         if not ready:
-            time = procs[i]["arrival"]
+            time = procs[i].arrival
             continue
-        ready.sort(key=lambda x: x["burst"])
+        ready.sort(key=by_burst)
         p = ready.pop(0)
         start = time
-        finish = start + p["burst"]
-        gantt.append((p["id"], start, finish))
-        stats[p["id"]] = {"waiting": start - p["arrival"], "turnaround": finish - p["arrival"]}
+        finish = start + p.burst
+        gantt.append((p.id, start, finish))
+        stats[p.id] = {"waiting": start - p.arrival, "turnaround": finish - p.arrival}
         time = finish
     return gantt, stats
 
 def srtf_preemptive(processes):
     # SRTF: simulate time unit by unit
-    procs = sorted(processes, key=lambda p: p["arrival"])
+    procs = sorted(as_processes(processes), key=by_arrival)
     n = len(procs)
-    remaining = {p["id"]: p["burst"] for p in procs}
-    arrival_map = {p["id"]: p["arrival"] for p in procs}
+    remaining = {p.id: p.burst for p in procs}
     time = 0
     i = 0
     heap = []
     current = None
     gantt = []
     start_time = None
-    finished = set()
-    while len(finished) < n:
+    finish_time = {}
+    while len(finish_time) < n:
         # push arrivals
-        while i < n and procs[i]["arrival"] <= time:
-            heapq.heappush(heap, (remaining[procs[i]["id"]], procs[i]["id"]))
+        while i < n and procs[i].arrival <= time:
+            heapq.heappush(heap, (remaining[procs[i].id], procs[i].id))
             i += 1
         if not heap:
             time += 1
@@ -77,39 +81,27 @@ def srtf_preemptive(processes):
             current = pid
             start_time = time
         # execute 1 unit
-        remaining[pid] -= 1
+        rem -= 1
+        remaining[pid] = rem
         time += 1
-        if remaining[pid] > 0:
-            heapq.heappush(heap, (remaining[pid], pid))
+        if rem > 0:
+            heapq.heappush(heap, (rem, pid))
         else:
             # finished
             gantt.append((pid, start_time, time))
-            finished.add(pid)
+            finish_time[pid] = time
             start_time = None
             current = None
-    # compute stats
+    # compute stats: turnaround = finish_time - arrival
     stats = {}
     for p in procs:
-        pid = p["id"]
-        # turnaround = finish_time - arrival
-        # find last finish in gantt for pid
-        finishes = [seg[2] for seg in gantt if seg[0] == pid]
-        finish = max(finishes) if finishes else p["arrival"]
-        burst = p["burst"]
-        tat = finish - p["arrival"]
-        wt = tat - burst
-        stats[pid] = {"waiting": wt, "turnaround": tat}
+        tat = finish_time[p.id] - p.arrival
+        stats[p.id] = {"waiting": tat - p.burst, "turnaround": tat}
     # merge adjacent segments of same pid (to make chart cleaner)
-    merged = []
-    for seg in gantt:
-        if merged and merged[-1][0] == seg[0] and merged[-1][2] == seg[1]:
-            merged[-1] = (merged[-1][0], merged[-1][1], seg[2])
-        else:
-            merged.append(seg)
-    return merged, stats
+    return merge_segments(gantt), stats
 
 def priority_non_preemptive(processes):
-    procs = sorted(processes, key=lambda p: p["arrival"])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     i = 0
     ready = []
@@ -117,68 +109,81 @@ def priority_non_preemptive(processes):
     stats = {}
     n = len(procs)
     while i < n or ready:
-        while i < n and procs[i]["arrival"] <= time:
+        while i < n and procs[i].arrival <= time:
             ready.append(procs[i])
             i += 1
         if not ready:
-            time = procs[i]["arrival"]
+            time = procs[i].arrival
             continue
-        ready.sort(key=lambda x: (x.get("priority", 0), x["arrival"]))
+        ready.sort(key=by_priority)
         p = ready.pop(0)
         start = time
-        finish = start + p["burst"]
-        gantt.append((p["id"], start, finish))
-        stats[p["id"]] = {"waiting": start - p["arrival"], "turnaround": finish - p["arrival"]}
+        finish = start + p.burst
+        gantt.append((p.id, start, finish))
+        stats[p.id] = {"waiting": start - p.arrival, "turnaround": finish - p.arrival}
         time = finish
     return gantt, stats
 
 def round_robin(processes, quantum=2):
-    procs = sorted(processes, key=lambda p: p["arrival"])
-    from collections import deque
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     i = 0
+    n = len(procs)
     q = deque()
-    remaining = {p["id"]: p["burst"] for p in procs}
-    arrivals = {p["id"]: p["arrival"] for p in procs}
+    remaining = {p.id: p.burst for p in procs}
+    finish_time = {}
     gantt = []
-    last_exec = {}
     # load initial arrivals
-    while i < len(procs) and procs[i]["arrival"] <= time:
+    while i < n and procs[i].arrival <= time:
         q.append(procs[i])
         i += 1
-    if not q and i < len(procs):
-        time = procs[i]["arrival"]
+    if not q and i < n:
+        time = procs[i].arrival
         q.append(procs[i]); i+=1
     while q:
         p = q.popleft()
-        pid = p["id"]
+        pid = p.id
         start = time
-        exec_time = min(quantum, remaining[pid])
+        rem = remaining[pid]
+        exec_time = min(quantum, rem)
         time += exec_time
-        remaining[pid] -= exec_time
+        rem -= exec_time
+        remaining[pid] = rem
         gantt.append((pid, start, time))
         # push newly arrived processes while we executed
-        while i < len(procs) and procs[i]["arrival"] <= time:
+        while i < n and procs[i].arrival <= time:
             q.append(procs[i]); i += 1
-        if remaining[pid] > 0:
+        if rem > 0:
             q.append(p)
+        else:
+            finish_time[pid] = time
     # stats
     stats = {}
     for p in procs:
-        pid = p["id"]
-        finishes = [seg[2] for seg in gantt if seg[0] == pid]
-        finish = max(finishes) if finishes else p["arrival"]
-        tat = finish - p["arrival"]
-        wt = tat - p["burst"]
-        stats[pid] = {"waiting": wt, "turnaround": tat}
+        finish = finish_time.get(p.id, p.arrival)
+        tat = finish - p.arrival
+        stats[p.id] = {"waiting": tat - p.burst, "turnaround": tat}
     # merge contiguous
+    return merge_segments(gantt), stats
+
+def mlfq(processes, quanta=(2, 4, 8), boost=None):
+    # event-driven core lives in mlfq.py; only the stats shape differs here
+    procs = as_processes(processes)
+    gantt, results = mlfq_schedule(procs, quanta, boost)
+    stats = {}
+    for p in procs:
+        tat = results[p.id]["finish"] - p.arrival
+        stats[p.id] = {"waiting": tat - p.burst, "turnaround": tat}
+    return gantt, stats
+
+def merge_segments(gantt):
     merged = []
     for seg in gantt:
         if merged and merged[-1][0] == seg[0] and merged[-1][2] == seg[1]:
             merged[-1] = (merged[-1][0], merged[-1][1], seg[2])
         else:
             merged.append(seg)
-    return merged, stats
+    return merged
 
 # ---------------- GUI App ---------------- #
 class SchedulerApp:
@@ -186,7 +191,6 @@ class SchedulerApp:
         self.root = root
         root.title("CPU Scheduling Visualizer — Modern GUI")
         root.geometry("1000x650")
-        self.style = tb.Style("cosmo")  # modern theme
 
         # Left frame: controls + process table
         left = ttk.Frame(root)
@@ -235,30 +239,34 @@ class SchedulerApp:
         algo_frame = ttk.LabelFrame(left, text="Algorithm")
         algo_frame.pack(fill=X, pady=6, padx=0)
         self.algo_var = tk.StringVar(value="FCFS")
-        algos = ["FCFS", "SJF (Non-Preemptive)", "SRTF (Preemptive SJF)", "Priority (Non-Preemptive)", "Round Robin"]
+        algos = ["FCFS", "SJF (Non-Preemptive)", "SRTF (Preemptive SJF)", "Priority (Non-Preemptive)", "Round Robin", "MLFQ"]
         ttk.Label(algo_frame, text="Choose:").grid(row=0, column=0, padx=6, pady=6, sticky=W)
         self.combo = ttk.Combobox(algo_frame, values=algos, textvariable=self.algo_var, state="readonly")
         self.combo.grid(row=0, column=1, padx=6, pady=6)
         self.combo.current(0)
 
-        ttk.Label(algo_frame, text="Quantum (RR):").grid(row=1, column=0, padx=6, sticky=W)
+        ttk.Label(algo_frame, text="Quantum (RR/MLFQ):").grid(row=1, column=0, padx=6, sticky=W)
         self.quantum_ent = ttk.Entry(algo_frame, width=8)
         self.quantum_ent.grid(row=1, column=1, padx=6, sticky=W)
         self.quantum_ent.insert(0, "2")
 
+        # MLFQ uses 3 levels with quanta q, 2q, 4q
+        ttk.Label(algo_frame, text="Boost every (MLFQ):").grid(row=2, column=0, padx=6, sticky=W)
+        self.boost_ent = ttk.Entry(algo_frame, width=8)
+        self.boost_ent.grid(row=2, column=1, padx=6, sticky=W)
+        self.boost_ent.insert(0, "20")
+
         btn_run = ttk.Button(algo_frame, text="Run", bootstyle="primary", command=self.run)
-        btn_run.grid(row=2, column=0, columnspan=2, pady=8)
+        btn_run.grid(row=3, column=0, columnspan=2, pady=8)
 
         # right frame: chart + stats
         right = ttk.Frame(root)
         right.pack(side=RIGHT, fill=BOTH, expand=True, padx=10, pady=10)
 
-        self.fig = Figure(figsize=(7, 3.5))
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_yticks([])
-
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right)
-        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        # the figure is built on first Run; matplotlib is prefetched meanwhile
+        chart_frame = ttk.Frame(right)
+        chart_frame.pack(fill=BOTH, expand=True)
+        self.chart = LazyChart(chart_frame, figsize=(7, 3.5))
 
         stats_frame = ttk.LabelFrame(right, text="Stats (Waiting / Turnaround)")
         stats_frame.pack(fill=BOTH, expand=False, pady=6)
@@ -268,6 +276,10 @@ class SchedulerApp:
         self.stats_tree.heading("waiting", text="Waiting")
         self.stats_tree.heading("turnaround", text="Turnaround")
 
+        # averages and p50/p90/p99 for the whole run
+        self.summary_lbl = ttk.Label(stats_frame, text="", justify=LEFT, anchor=W)
+        self.summary_lbl.pack(fill=X, padx=6, pady=(0, 6))
+
         # status
         self.status = ttk.Label(root, text="Ready", anchor=W)
         self.status.pack(side=BOTTOM, fill=X)
@@ -320,7 +332,7 @@ class SchedulerApp:
         procs = []
         for iid in self.tree.get_children():
             arr, burst, pr = self.tree.item(iid, "values")
-            procs.append({"id": iid, "arrival": float(arr), "burst": float(burst), "priority": int(pr)})
+            procs.append(Process(iid, float(arr), float(burst), int(pr)))
         return procs
 
     def run(self):
@@ -344,6 +356,13 @@ class SchedulerApp:
                     messagebox.showerror("Quantum error", "Quantum must be > 0")
                     return
                 gantt, stats = round_robin(procs, quantum=q)
+            elif algo == "MLFQ":
+                q = float(self.quantum_ent.get())
+                boost = float(self.boost_ent.get())
+                if q <= 0 or boost <= 0:
+                    messagebox.showerror("Quantum error", "Quantum and boost interval must be > 0")
+                    return
+                gantt, stats = mlfq(procs, quanta=quanta_for(q), boost=boost)
             else:
                 messagebox.showerror("Unknown", "Unknown algorithm selected.")
                 return
@@ -354,46 +373,55 @@ class SchedulerApp:
         # draw gantt
         self.draw_gantt(gantt, title=algo)
         # show stats
-        self.show_stats(stats)
-        self.status.config(text=f"Ran {algo}")
+        self.show_stats(stats, metrics_from_schedule(procs, gantt).summary())
 
     def draw_gantt(self, gantt, title="Gantt Chart"):
-        self.ax.clear()
+        ax = self.chart.ensure()
+        ax.clear()
         colors = {}
-        cmap = self.fig.canvas.get_supported_filetypes()  # dummy to avoid lint; we won't use this
+        bars = []
         y = 0.5
         for seg in gantt:
             pid, start, finish = seg
-            width = finish - start
             if pid not in colors:
                 # generate simple color from hash
                 import random
                 random.seed(hash(pid) & 0xFFFFFFFF)
                 colors[pid] = (random.random()*0.6+0.2, random.random()*0.6+0.2, random.random()*0.6+0.2)
-            self.ax.barh(y, width, left=start, height=0.6, align='center', edgecolor='k', color=colors[pid])
-            self.ax.text(start + width/2, y, pid, va='center', ha='center', color='white', fontsize=9, fontweight='bold')
+            bars.append((pid, y, start, finish))
             y += 1
-        self.ax.set_yticks([])
-        self.ax.set_xlabel("Time")
-        self.ax.set_title(title)
+        # one collection for every segment keeps zoom redraws cheap on long schedules
+        self.chart.draw_bars(bars, colors, edgecolor='k', color='white', fontsize=9, fontweight='bold')
+        ax.set_yticks([])
+        ax.set_xlabel("Time")
+        ax.set_title(title)
         # adjust x limits
         starts = [s for (_, s, _) in gantt] if gantt else [0]
         ends = [e for (_, _, e) in gantt] if gantt else [0]
-        self.ax.set_xlim(min(starts) - 1 if starts else 0, max(ends) + 1 if ends else 1)
-        self.ax.invert_yaxis()
-        self.fig.tight_layout()
-        self.canvas.draw()
-
-    def show_stats(self, stats):
+        ax.set_xlim(min(starts) - 1 if starts else 0, max(ends) + 1 if ends else 1)
+        ax.invert_yaxis()
+        # hover shows who runs at t; wheel zoom reports utilization of the visible window
+        index = GanttIndex(gantt)
+        self.chart.set_index(index, on_window=lambda a, b: self.status.config(
+            text=f"{title} | {index.describe_window(a, b)}"))
+        self.chart.fig.tight_layout()
+        self.chart.canvas.draw()
+
+    def show_stats(self, stats, summary=None):
         for r in self.stats_tree.get_children():
             self.stats_tree.delete(r)
         # sort by process id
         for pid in sorted(stats.keys()):
             self.stats_tree.insert("", "end", iid=pid, values=(stats[pid]["waiting"], stats[pid]["turnaround"]))
+        self.summary_lbl.config(text="\n".join(format_summary(summary)) if summary else "")
 
 def main():
-    root = tb.Window()
+    # ttkbootstrap must be imported before any ttk widget is created
+    import ttkbootstrap as tb
+    root = tb.Window(themename="cosmo")  # modern theme, built once
     app = SchedulerApp(root)
+    root.after_idle(lambda: app.status.config(text=f"Ready in {time.perf_counter() - _STARTED:.2f} s"))
+    root.after(200, prefetch_chart_modules)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,332 @@
+"""
+Benchmarks for the scheduler GUIs and algorithms.
+
+Usage:
+   python benchmark.py startup      # cold start + import-time breakdown
+   python benchmark.py process      # Process records vs dicts
+   python benchmark.py metrics      # streaming quantile sketches vs exact sort
+   python benchmark.py gantt        # interval index queries vs linear scans
+   python benchmark.py mlfq         # MLFQ vs round robin at 10^6 processes
+   python benchmark.py simulate     # event-queue simulator, CPU/I/O bursts
+   python benchmark.py report       # headless chart rendering in a process pool
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ---------------- Start-up ---------------- #
+
+# builds the window shell exactly like the entry points do, then exits
+_GUI_SNIPPET = '''
+import time, {module} as m
+import ttkbootstrap as tb
+try:
+    root = tb.Window(themename={theme!r})
+except Exception as e:
+    print('skipped', type(e).__name__)
+else:
+    m.{cls}(root)
+    root.update()
+    print('%.4f' % (time.perf_counter() - m._STARTED))
+    root.destroy()
+'''
+
+_ENTRY_POINTS = [
+    ('app', 'SchedulerApp', 'cosmo'),
+    ('main', 'App', 'cyborg'),
+]
+
+
+def import_breakdown(code):
+    """Run `code` in a fresh interpreter with -X importtime.
+
+    Returns (total_us, {top-level package: self time in us}).
+    """
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                         capture_output=True, text=True, cwd=HERE)
+    per_pkg = {}
+    total = 0
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        pkg = name.strip().split('.')[0]
+        per_pkg[pkg] = per_pkg.get(pkg, 0) + int(self_us)
+        total += int(self_us)
+    return total, per_pkg
+
+
+def _print_breakdown(title, total, per_pkg, top=8):
+    print(f'{title}: {total / 1e3:.1f} ms of imports')
+    for pkg, us in sorted(per_pkg.items(), key=lambda kv: -kv[1])[:top]:
+        print(f'    {pkg:<24} {us / 1e3:8.1f} ms')
+
+
+def bench_startup(args):
+    for module, cls, theme in _ENTRY_POINTS:
+        # everything the window shell needs before it can be shown
+        total, per_pkg = import_breakdown(f'import {module}, ttkbootstrap')
+        _print_breakdown(f'import {module} + ttkbootstrap', total, per_pkg)
+        out = subprocess.run([sys.executable, '-c', _GUI_SNIPPET.format(module=module, cls=cls, theme=theme)],
+                             capture_output=True, text=True, cwd=HERE)
+        shown = out.stdout.strip() or out.stderr.strip().splitlines()[-1]
+        if shown.startswith('skipped'):
+            print(f'    window shell: {shown} (no display?)')
+        else:
+            print(f'    window shell: {float(shown) * 1e3:.1f} ms')
+        print()
+    # cost that is now paid on first Run / in the background prefetch
+    total, per_pkg = import_breakdown('import chart; chart.load_chart_modules()')
+    _print_breakdown('deferred chart import', total, per_pkg)
+
+
+# ---------------- Process records ---------------- #
+
+def random_workload(n, seed=0):
+    rnd = random.Random(seed)
+    return [{'id': f'P{i}', 'arrival': rnd.randint(0, n), 'burst': rnd.randint(1, 20),
+             'priority': rnd.randint(0, 9)} for i in range(n)]
+
+
+def _timed(fn, *args, **kwargs):
+    t = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - t
+
+
+def _bytes_per_item(build, n):
+    tracemalloc.start()
+    items = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / n
+
+
+def bench_process(args):
+    import app
+    import main as gui_main
+    from process import as_processes
+
+    n = args.n
+    dicts = random_workload(n)
+    print(f'per-process memory (n={n}):')
+    print(f'    dict     {_bytes_per_item(lambda: [dict(d) for d in dicts], n):7.1f} B')
+    print(f'    Process  {_bytes_per_item(lambda: as_processes(dicts), n):7.1f} B')
+
+    procs = as_processes(dicts)
+    reps = max(1, 2_000_000 // n)
+    t_dict = _timed(lambda: [sum(p['arrival'] + p['burst'] for p in dicts) for _ in range(reps)])
+    t_slot = _timed(lambda: [sum(p.arrival + p.burst for p in procs) for _ in range(reps)])
+    print(f'field reads: dict {t_dict / (reps * n) * 1e9:.1f} ns, Process {t_slot / (reps * n) * 1e9:.1f} ns per record')
+
+    print('schedulers (dict input through the shim / Process input):')
+    for mod in (app, gui_main):
+        for name in ('fcfs', 'sjf_non_preemptive', 'priority_non_preemptive', 'round_robin'):
+            fn = getattr(mod, name)
+            print(f'    {mod.__name__}.{name:<26} {_timed(fn, dicts) * 1e3:8.1f} ms / {_timed(fn, procs) * 1e3:8.1f} ms')
+
+
+# ---------------- Streaming metrics ---------------- #
+
+def _completions(n, seed):
+    # synthetic (waiting, turnaround, response) with a heavy tail
+    rnd = random.Random(seed)
+    for _ in range(n):
+        burst = rnd.randint(1, 20)
+        waiting = rnd.paretovariate(1.5) * 10 - 10
+        yield waiting, waiting + burst, waiting * rnd.random()
+
+
+def bench_metrics(args):
+    import math
+    from metrics import QUANTILES, StreamingMetrics
+
+    n, shards = args.n, args.shards
+    tracemalloc.start()
+    t = time.perf_counter()
+    parts = []
+    for s in range(shards):
+        m = StreamingMetrics()
+        for w, tat, r in _completions(n // shards, seed=s):
+            m.add(w, tat, r)
+        parts.append(m)
+    merged = parts[0]
+    for m in parts[1:]:
+        merged.merge(m)
+    elapsed = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'sketch: {merged.count} completions in {shards} merged shards, '
+          f'{elapsed:.2f} s, peak {peak / 1e6:.2f} MB')
+
+    tracemalloc.start()
+    t = time.perf_counter()
+    waiting = [w for s in range(shards) for w, _, _ in _completions(n // shards, seed=s)]
+    waiting.sort()
+    elapsed = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'exact sort (waiting only): {elapsed:.2f} s, peak {peak / 1e6:.2f} MB')
+
+    sk = merged.sketches['waiting']
+    for q in QUANTILES:
+        exact = waiting[max(0, math.ceil(q * len(waiting)) - 1)]
+        est = sk.quantile(q)
+        err = abs(est - exact) / exact if exact else abs(est)
+        print(f'    waiting p{q * 100:g}: exact {exact:.3f}  sketch {est:.3f}  rel.err {err:.4f}')
+
+
+# ---------------- Gantt interval index ---------------- #
+
+def bench_gantt(args):
+    from gantt_index import GanttIndex
+
+    n, queries = args.n, args.queries
+    rnd = random.Random(0)
+    gantt = []
+    t = 0
+    for i in range(n):
+        t += rnd.randint(0, 2)  # occasional idle gaps
+        burst = rnd.randint(1, 5)
+        gantt.append((f'P{i % 1000}', t, t + burst))
+        t += burst
+    end = t
+
+    build = _timed(GanttIndex, gantt)
+    index = GanttIndex(gantt)
+    points = [rnd.uniform(0, end) for _ in range(queries)]
+    windows = [(a, a + end / 100) for a in points]
+    print(f'{n} segments, index built in {build * 1e3:.1f} ms')
+
+    t_at = _timed(lambda: [index.at(x) for x in points])
+    t_busy = _timed(lambda: [index.busy(a, b) for a, b in windows])
+    t_share = _timed(lambda: [index.share('P7', a, b) for a, b in windows])
+    print(f'    index: at {t_at / queries * 1e6:.2f} us, busy {t_busy / queries * 1e6:.2f} us, '
+          f'share {t_share / queries * 1e6:.2f} us per query')
+
+    few = points[:max(1, queries // 1000)]
+    t_scan = _timed(lambda: [next((s for s in gantt if s[1] <= x < s[2]), None) for x in few])
+    t_scan_busy = _timed(lambda: [sum(max(0, min(f, x + end / 100) - max(s, x)) for _, s, f in gantt) for x in few])
+    print(f'    linear scan: at {t_scan / len(few) * 1e6:.0f} us, busy {t_scan_busy / len(few) * 1e6:.0f} us per query')
+
+
+# ---------------- MLFQ ---------------- #
+
+def bench_mlfq(args):
+    import main as gui_main
+    from mlfq import mlfq, quanta_for
+    from process import as_processes
+
+    procs = as_processes(random_workload(args.n))
+    quanta = quanta_for(args.quantum)
+    t_rr = _timed(gui_main.round_robin, procs, quantum=args.quantum)
+    t_mlfq = _timed(mlfq, procs, quanta=quanta)
+    t_boost = _timed(mlfq, procs, quanta=quanta, boost=args.boost)
+    print(f'n={args.n}, quantum {args.quantum}:')
+    print(f'    round_robin              {t_rr:6.2f} s')
+    print(f'    mlfq {str(quanta):<19} {t_mlfq:6.2f} s')
+    print(f'    mlfq + boost every {args.boost:<5} {t_boost:6.2f} s')
+
+
+# ---------------- Event-queue simulator ---------------- #
+
+def io_workload(n, cpu_bursts, seed=0):
+    from process import Process
+
+    rnd = random.Random(seed)
+    procs = []
+    for i in range(n):
+        bursts = [rnd.randint(1, 8)]
+        for _ in range(cpu_bursts - 1):
+            bursts.append(rnd.randint(5, 40))   # I/O
+            bursts.append(rnd.randint(1, 8))    # CPU
+        # ~45 CPU units per process spread over 56 time units each: roughly 80% load
+        procs.append(Process.with_bursts(f'P{i}', rnd.randint(0, n * 56), bursts, rnd.randint(0, 9)))
+    return procs
+
+
+def _max_rss_mb():
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def bench_simulate(args):
+    from simulator import POLICIES, simulate
+
+    t = time.perf_counter()
+    procs = io_workload(args.n, args.bursts)
+    print(f'{args.n} processes x {args.bursts} CPU bursts built in {time.perf_counter() - t:.1f} s, '
+          f'rss {_max_rss_mb():.0f} MB')
+    for policy in args.policies or POLICIES:
+        t = time.perf_counter()
+        res = simulate(procs, policy, quantum=args.quantum if policy == 'RR' else None, record=False)
+        elapsed = time.perf_counter() - t
+        w = res.metrics.summary()['waiting']
+        print(f'    {policy:<9} {elapsed:6.1f} s  util {res.utilization:6.1%}  '
+              f'throughput {res.throughput:.3f}/t  waiting avg {w["mean"]:.1f} p99 {w["p99"]:.1f}  '
+              f'rss {_max_rss_mb():.0f} MB')
+
+
+# ---------------- Headless reports ---------------- #
+
+def bench_report(args):
+    import tempfile
+    from report import build_report, random_workloads
+
+    workers = args.workers or os.cpu_count() or 1
+    workloads = random_workloads(args.workloads, args.n)
+    with tempfile.TemporaryDirectory() as out_dir:
+        t = time.perf_counter()
+        out = build_report(workloads, out_dir, fmt=args.format, workers=workers)
+        elapsed = time.perf_counter() - t
+    charts = len(out['charts'])
+    print(f'{charts} charts ({args.format}, {args.n} processes each) with {workers} worker(s): '
+          f'{elapsed:.1f} s, {elapsed / charts * 1e3 * workers:.0f} ms per chart per worker')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    sub.add_parser('startup', help='cold start time with import-time breakdown').set_defaults(func=bench_startup)
+    p = sub.add_parser('process', help='memory and attribute cost of Process vs dict')
+    p.add_argument('--n', type=int, default=5000)
+    p.set_defaults(func=bench_process)
+    p = sub.add_parser('metrics', help='streaming quantile sketches vs exact sorting')
+    p.add_argument('--n', type=int, default=1_000_000)
+    p.add_argument('--shards', type=int, default=4)
+    p.set_defaults(func=bench_metrics)
+    p = sub.add_parser('gantt', help='interval index queries vs linear scans')
+    p.add_argument('--n', type=int, default=1_000_000)
+    p.add_argument('--queries', type=int, default=100_000)
+    p.set_defaults(func=bench_gantt)
+    p = sub.add_parser('mlfq', help='MLFQ vs round robin')
+    p.add_argument('--n', type=int, default=1_000_000)
+    p.add_argument('--quantum', type=int, default=2)
+    p.add_argument('--boost', type=int, default=100)
+    p.set_defaults(func=bench_mlfq)
+    p = sub.add_parser('simulate', help='event-queue simulator with CPU/I/O bursts')
+    p.add_argument('--n', type=int, default=1_000_000)
+    p.add_argument('--bursts', type=int, default=10, help='CPU bursts per process (I/O in between)')
+    p.add_argument('--quantum', type=int, default=4)
+    p.add_argument('--policies', nargs='*', choices=('FCFS', 'SJF', 'SRTF', 'Priority', 'RR'))
+    p.set_defaults(func=bench_simulate)
+    p = sub.add_parser('report', help='headless comparison report rendering')
+    p.add_argument('--workloads', type=int, default=100, help='x5 policies = charts')
+    p.add_argument('--n', type=int, default=40)
+    p.add_argument('--format', choices=('png', 'svg'), default='png')
+    p.add_argument('--workers', type=int, default=None)
+    p.set_defaults(func=bench_report)
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Lazy chart backend shared by both GUIs.
+
+matplotlib and its TkAgg backend account for most of the start-up time, so
+they are imported on first use (or prefetched in a background thread once the
+window is on screen) instead of at module import.
+"""
+
+import threading
+
+_lock = threading.Lock()
+_modules = None
+
+
+def load_chart_modules():
+    """Return (Figure, FigureCanvasTkAgg), importing matplotlib on first call."""
+    global _modules
+    with _lock:
+        if _modules is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            _modules = (Figure, FigureCanvasTkAgg)
+    return _modules
+
+
+def prefetch_chart_modules():
+    # only the import happens off the main thread; no Tk calls are made here
+    threading.Thread(target=load_chart_modules, name='chart-prefetch', daemon=True).start()
+
+
+class LazyChart:
+    """Figure + Tk canvas that are built inside `master` on first use.
+
+    After a Gantt is drawn, set_index() enables hover tooltips (who runs at
+    the cursor) and mouse-wheel zoom; on_window(a, b) is called with the
+    visible time range whenever it changes. The tooltip is blitted over a
+    cached background, so hovering never redraws the segments.
+    """
+
+    ZOOM_STEP = 0.8
+    MAX_LABELS = 200    # past this many bars only the tooltip names a segment
+
+    def __init__(self, master, figsize):
+        self.master = master
+        self.figsize = figsize
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self.index = None
+        self.on_window = None
+        self._tip = None
+        self._tip_seg = None
+        self._background = None
+
+    def ensure(self):
+        if self.fig is None:
+            Figure, FigureCanvasTkAgg = load_chart_modules()
+            self.fig = Figure(figsize=self.figsize)
+            self.ax = self.fig.add_subplot(111)
+            self.canvas = FigureCanvasTkAgg(self.fig, master=self.master)
+            self.canvas.get_tk_widget().pack(fill='both', expand=True)
+            self.canvas.mpl_connect('motion_notify_event', self._on_motion)
+            self.canvas.mpl_connect('scroll_event', self._on_scroll)
+            self.canvas.mpl_connect('draw_event', self._on_draw)
+        return self.ax
+
+    def draw_bars(self, bars, colors, height=0.6, edgecolor='none', **text_kw):
+        """Draw (pid, y, start, finish) bars as a single collection.
+
+        Bars are labelled with their pid (text_kw styles the label) while
+        there are at most MAX_LABELS of them.
+        """
+        from matplotlib.collections import PolyCollection
+
+        ax = self.ax
+        h = height / 2
+        verts = [((s, y - h), (s, y + h), (f, y + h), (f, y - h)) for _, y, s, f in bars]
+        ax.add_collection(PolyCollection(verts, facecolors=[colors[bar[0]] for bar in bars],
+                                         edgecolors=edgecolor))
+        ax.autoscale_view()
+        if len(bars) <= self.MAX_LABELS:
+            for pid, y, s, f in bars:
+                ax.text((s + f) / 2, y, pid, va='center', ha='center', **text_kw)
+
+    def set_index(self, index, on_window=None):
+        # call after drawing: ax.clear() drops the previous tooltip artist
+        self.index = index
+        self.on_window = on_window
+        # animated: left out of full draws and blitted on its own
+        self._tip = self.ax.annotate('', xy=(0, 0), xytext=(10, 10), textcoords='offset points',
+                                     fontsize=9, bbox=dict(boxstyle='round', fc='w', alpha=0.9),
+                                     visible=False, animated=True)
+        self._tip_seg = None
+        if on_window is not None:
+            on_window(*self.ax.get_xlim())
+
+    def _on_motion(self, event):
+        if self._tip is None:
+            return
+        seg = None
+        if event.inaxes is self.ax and event.xdata is not None:
+            seg = self.index.at(event.xdata)
+        if seg == self._tip_seg:
+            return  # only redraw when the hovered segment changes
+        self._tip_seg = seg
+        if seg is None:
+            self._tip.set_visible(False)
+        else:
+            pid, start, finish = seg
+            self._tip.xy = ((start + finish) / 2, event.ydata)
+            self._tip.set_text(f'{pid}: {start:g} - {finish:g}')
+            self._tip.set_visible(True)
+        self._blit_tip()
+
+    def _on_draw(self, event):
+        # a full draw (new chart, zoom, resize): cache it without the tooltip
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        if self._tip is not None and self._tip.get_visible():
+            self.ax.draw_artist(self._tip)
+
+    def _blit_tip(self):
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        if self._tip.get_visible():
+            self.ax.draw_artist(self._tip)
+        self.canvas.blit(self.fig.bbox)
+
+    def _on_scroll(self, event):
+        if self.index is None or event.inaxes is not self.ax or event.xdata is None:
+            return
+        scale = self.ZOOM_STEP if event.button == 'up' else 1 / self.ZOOM_STEP
+        a, b = self.ax.get_xlim()
+        x = event.xdata
+        a, b = x - (x - a) * scale, x + (b - x) * scale
+        self.ax.set_xlim(a, b)
+        if self.on_window is not None:
+            self.on_window(a, b)
+        self.canvas.draw_idle()
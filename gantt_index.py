@@ -0,0 +1,113 @@
+"""
+Interval index over a single-CPU Gantt chart.
+
+Segments never overlap, so once sorted by start their finishes are sorted as
+well and every query is a bisect over flat arrays:
+
+- at(t)               -> segment running at time t (or None)
+- window(a, b)        -> segments overlapping [a, b)
+- busy(a, b)          -> CPU time used inside [a, b), via prefix sums
+- share(pid, a, b)    -> CPU time of one process inside [a, b)
+
+Build is O(n log n) once per run; each query is O(log n).
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class _Runs:
+    """Sorted start/finish arrays plus prefix sums of segment lengths."""
+    __slots__ = ('starts', 'finishes', 'prefix')
+
+    def __init__(self):
+        self.starts = []
+        self.finishes = []
+        self.prefix = [0]
+
+    def append(self, start, finish):
+        self.starts.append(start)
+        self.finishes.append(finish)
+        self.prefix.append(self.prefix[-1] + (finish - start))
+
+    def busy(self, a, b):
+        if b <= a:
+            return 0
+        starts, finishes = self.starts, self.finishes
+        lo = bisect_right(finishes, a)    # first segment ending after a
+        hi = bisect_left(starts, b)       # first segment starting at/after b
+        if lo >= hi:
+            return 0
+        total = self.prefix[hi] - self.prefix[lo]
+        # clip the two edge segments to the window
+        if starts[lo] < a:
+            total -= a - starts[lo]
+        if finishes[hi - 1] > b:
+            total -= finishes[hi - 1] - b
+        return total
+
+
+class GanttIndex:
+    def __init__(self, gantt):
+        self.segments = sorted(gantt, key=lambda seg: seg[1])
+        self._all = _Runs()
+        self._by_pid = {}
+        for pid, start, finish in self.segments:
+            self._all.append(start, finish)
+            runs = self._by_pid.get(pid)
+            if runs is None:
+                runs = self._by_pid[pid] = _Runs()
+            runs.append(start, finish)
+
+    def __len__(self):
+        return len(self.segments)
+
+    @property
+    def start(self):
+        return self.segments[0][1] if self.segments else 0
+
+    @property
+    def end(self):
+        return self.segments[-1][2] if self.segments else 0
+
+    def at(self, t):
+        """(pid, start, finish) running at time t, None when the CPU is idle."""
+        i = bisect_right(self._all.starts, t) - 1
+        if i >= 0 and t < self._all.finishes[i]:
+            return self.segments[i]
+        return None
+
+    def window(self, a, b):
+        """Segments overlapping [a, b), unclipped."""
+        lo = bisect_right(self._all.finishes, a)
+        hi = bisect_left(self._all.starts, b)
+        return self.segments[lo:hi]
+
+    def busy(self, a, b):
+        return self._all.busy(a, b)
+
+    def utilization(self, a, b):
+        return self._all.busy(a, b) / (b - a) if b > a else 0
+
+    def share(self, pid, a, b):
+        runs = self._by_pid.get(pid)
+        return runs.busy(a, b) if runs is not None else 0
+
+    def shares(self, a, b):
+        """{pid: CPU time inside [a, b)} for processes that ran in the window."""
+        out = {}
+        for pid, runs in self._by_pid.items():
+            t = runs.busy(a, b)
+            if t > 0:
+                out[pid] = t
+        return out
+
+    def describe_window(self, a, b, top=3):
+        """Short text for the status line, e.g. 't 0.0-11.0: CPU 100% | P1 64%, P2 36%'."""
+        length = b - a
+        if length <= 0:
+            return ''
+        text = f't {a:.1f}-{b:.1f}: CPU {self.utilization(a, b):.0%}'
+        shares = sorted(self.shares(a, b).items(), key=lambda kv: -kv[1])[:top]
+        if shares:
+            text += ' | ' + ', '.join(f'{pid} {t / length:.0%}' for pid, t in shares)
+        return text
@@ -8,6 +8,7 @@ Features:
 - SRTF (preemptive SJF)
 - Priority (non-preemptive)
 - Round Robin
+- MLFQ (multi-level feedback queue)
 - Gantt chart embedded
 - Waiting time & Turnaround time calculation
 - Simple process table + Add / Remove rows
@@ -20,34 +21,41 @@ How to run:
 
 """
 
+import sys
+import time
+_STARTED = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox
-import ttkbootstrap as tb
-from ttkbootstrap.constants import *
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter.constants import *
 import heapq
+from collections import deque
+from chart import LazyChart, prefetch_chart_modules
+from gantt_index import GanttIndex
+from metrics import format_summary, metrics_from_schedule
+from mlfq import mlfq, quanta_for
+from process import Process, as_processes, by_arrival, by_burst, by_priority
 
 # ---------------- Scheduling Algorithms ---------------- #
 
 def fcfs(processes):
-    procs = sorted(processes, key=lambda x: x['arrival'])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     gantt = []
     results = {}
 
     for p in procs:
-        start = max(time, p['arrival'])
-        finish = start + p['burst']
-        gantt.append((p['id'], start, finish))
-        results[p['id']] = {'start': start, 'finish': finish}
+        start = max(time, p.arrival)
+        finish = start + p.burst
+        gantt.append((p.id, start, finish))
+        results[p.id] = {'start': start, 'finish': finish}
         time = finish
 
     return gantt, results
 
 
 def sjf_non_preemptive(processes):
-    procs = sorted(processes, key=lambda x: x['arrival'])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     i = 0
     ready = []
@@ -56,18 +64,18 @@ def sjf_non_preemptive(processes):
     n = len(procs)
 
     while i < n or ready:
-        while i < n and procs[i]['arrival'] <= time:
+        while i < n and procs[i].arrival <= time:
             ready.append(procs[i])
             i += 1
         if not ready:
-            time = procs[i]['arrival']
+            time = procs[i].arrival
             continue
-        ready.sort(key=lambda x: x['burst'])
+        ready.sort(key=by_burst)
         p = ready.pop(0)
         start = time
-        finish = time + p['burst']
-        gantt.append((p['id'], start, finish))
-        results[p['id']] = {'start': start, 'finish': finish}
+        finish = time + p.burst
+        gantt.append((p.id, start, finish))
+        results[p.id] = {'start': start, 'finish': finish}
         time = finish
 
     return gantt, results
@@ -75,65 +83,49 @@ def sjf_non_preemptive(processes):
 
 def sjf_preemptive(processes):
     # SRTF
-    procs = sorted(processes, key=lambda x: x['arrival'])
+    procs = sorted(as_processes(processes), key=by_arrival)
     n = len(procs)
     time = 0
     i = 0
-    heap = []  # (remaining, idx, proc)
-    remaining = {p['id']: p['burst'] for p in procs}
+    heap = []  # (remaining, idx) -- idx into procs/remaining
+    remaining = [p.burst for p in procs]
     gantt = []
-    current = None
+    current = None  # idx of the running process
     start_time = None
 
-    while i < n or heap or current:
-        while i < n and procs[i]['arrival'] <= time:
-            p = procs[i]
-            heapq.heappush(heap, (remaining[p['id']], i, p))
+    while i < n or heap or current is not None:
+        while i < n and procs[i].arrival <= time:
+            heapq.heappush(heap, (remaining[i], i))
             i += 1
 
-        if current and remaining[current] == 0:
-            gantt.append((current, start_time, time))
+        if current is not None and remaining[current] == 0:
+            gantt.append((procs[current].id, start_time, time))
             current = None
 
         if heap and (current is None or heap[0][0] < remaining[current]):
-            if current:
-                gantt.append((current, start_time, time))
-            rem, idx, p = heapq.heappop(heap)
-            current = p['id']
+            if current is not None:
+                gantt.append((procs[current].id, start_time, time))
+            rem, current = heapq.heappop(heap)
             start_time = time
 
-        if current:
+        if current is not None:
             remaining[current] -= 1
             time += 1
         else:
             # idle
             if i < n:
-                time = procs[i]['arrival']
+                time = procs[i].arrival
             else:
                 break
 
     # If last running still has remaining zero at time end, it was added
     # Build results: merge segments
-    results = {}
-    merged = []
-    for seg in gantt:
-        pid, s, f = seg
-        if merged and merged[-1][0] == pid and merged[-1][2] == s:
-            merged[-1] = (pid, merged[-1][1], f)
-        else:
-            merged.append(seg)
-    gantt = merged
-    for pid, s, f in gantt:
-        if pid not in results:
-            results[pid] = {'start': s, 'finish': f}
-        else:
-            results[pid]['finish'] = f
-
-    return gantt, results
+    gantt = merge_segments(gantt)
+    return gantt, results_from_gantt(gantt)
 
 
 def priority_non_preemptive(processes):
-    procs = sorted(processes, key=lambda x: x['arrival'])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
     i = 0
     ready = []
@@ -142,92 +134,97 @@ def priority_non_preemptive(processes):
     n = len(procs)
 
     while i < n or ready:
-        while i < n and procs[i]['arrival'] <= time:
+        while i < n and procs[i].arrival <= time:
             ready.append(procs[i])
             i += 1
         if not ready:
-            time = procs[i]['arrival']
+            time = procs[i].arrival
             continue
-        ready.sort(key=lambda x: (x.get('priority', 0), x['arrival']))
+        ready.sort(key=by_priority)
         p = ready.pop(0)
         start = time
-        finish = time + p['burst']
-        gantt.append((p['id'], start, finish))
-        results[p['id']] = {'start': start, 'finish': finish}
+        finish = time + p.burst
+        gantt.append((p.id, start, finish))
+        results[p.id] = {'start': start, 'finish': finish}
         time = finish
 
     return gantt, results
 
 
 def round_robin(processes, quantum=2):
-    procs = sorted(processes, key=lambda x: x['arrival'])
+    procs = sorted(as_processes(processes), key=by_arrival)
     time = 0
-    q = []
+    q = deque()
     i = 0
-    remaining = {p['id']: p['burst'] for p in procs}
-    last_enqueue = {}
+    n = len(procs)
+    remaining = {p.id: p.burst for p in procs}
     gantt = []
 
-    while i < len(procs) or q:
-        while i < len(procs) and procs[i]['arrival'] <= time:
+    while i < n or q:
+        while i < n and procs[i].arrival <= time:
             q.append(procs[i])
-            last_enqueue[procs[i]['id']] = procs[i]['arrival']
             i += 1
 
         if not q:
-            if i < len(procs):
-                time = procs[i]['arrival']
+            if i < n:
+                time = procs[i].arrival
                 continue
             else:
                 break
 
-        p = q.pop(0)
-        pid = p['id']
+        p = q.popleft()
+        pid = p.id
         start = time
         run = min(quantum, remaining[pid])
         remaining[pid] -= run
         time += run
-        finish = time
-        gantt.append((pid, start, finish))
+        gantt.append((pid, start, time))
 
         # enqueue arrivals that came during this quantum
-        while i < len(procs) and procs[i]['arrival'] <= time:
+        while i < n and procs[i].arrival <= time:
             q.append(procs[i])
-            last_enqueue[procs[i]['id']] = procs[i]['arrival']
             i += 1
 
         if remaining[pid] > 0:
-            q.append({'id': pid, 'arrival': time, 'burst': 0})  # placeholder with same id
+            q.append(p)  # requeue the same record, no placeholder needed
 
     # merge adjacent segments for same pid
+    gantt = merge_segments(gantt)
+    return gantt, results_from_gantt(gantt)
+
+
+def merge_segments(gantt):
     merged = []
     for seg in gantt:
-        if merged and merged[-1][0] == seg[0] and merged[-1][2] == seg[1]:
-            merged[-1] = (merged[-1][0], merged[-1][1], seg[2])
+        pid, s, f = seg
+        if merged and merged[-1][0] == pid and merged[-1][2] == s:
+            merged[-1] = (pid, merged[-1][1], f)
         else:
             merged.append(seg)
-    gantt = merged
+    return merged
+
 
+def results_from_gantt(gantt):
+    # first start / last finish per pid
     results = {}
     for pid, s, f in gantt:
         if pid not in results:
             results[pid] = {'start': s, 'finish': f}
         else:
             results[pid]['finish'] = f
-
-    return gantt, results
+    return results
 
 # ---------------- Utility: compute waiting & turnaround ---------------- #
 
 def compute_metrics(processes, results):
     metrics = {}
-    for p in processes:
-        pid = p['id']
+    for p in as_processes(processes):
+        pid = p.id
         if pid in results:
             start = results[pid]['start']
             finish = results[pid]['finish']
-            turnaround = finish - p['arrival']
-            waiting = turnaround - p['burst']
+            turnaround = finish - p.arrival
+            waiting = turnaround - p.burst
             metrics[pid] = {'waiting': waiting, 'turnaround': turnaround, 'start': start, 'finish': finish}
         else:
             metrics[pid] = {'waiting': None, 'turnaround': None}
@@ -240,7 +237,6 @@ class App:
         self.root = root
         root.title('CPU Scheduler - Modern GUI')
         root.geometry('1000x650')
-        style = tb.Style('cyborg')
 
         # Left frame: process table + controls
         left = ttk.Frame(root, padding=12)
@@ -253,15 +249,20 @@ class App:
         ttk.Label(controls, text='Algorithm:').grid(row=0, column=0, sticky=W)
         self.algo_var = tk.StringVar(value='FCFS')
         algo_menu = ttk.Combobox(controls, textvariable=self.algo_var, state='readonly', width=22)
-        algo_menu['values'] = ('FCFS', 'SJF (Non-Preemptive)', 'SRTF (Preemptive SJF)', 'Priority (Non-Preemptive)', 'Round Robin')
+        algo_menu['values'] = ('FCFS', 'SJF (Non-Preemptive)', 'SRTF (Preemptive SJF)', 'Priority (Non-Preemptive)', 'Round Robin', 'MLFQ')
         algo_menu.grid(row=0, column=1, padx=6, pady=4)
 
-        ttk.Label(controls, text='Quantum (RR):').grid(row=1, column=0, sticky=W)
+        ttk.Label(controls, text='Quantum (RR/MLFQ):').grid(row=1, column=0, sticky=W)
         self.quantum_var = tk.IntVar(value=2)
         ttk.Entry(controls, textvariable=self.quantum_var, width=8).grid(row=1, column=1, sticky=W)
 
+        # MLFQ: 3 levels with quanta q, 2q, 4q and a periodic boost to the top level
+        ttk.Label(controls, text='Boost every (MLFQ):').grid(row=2, column=0, sticky=W)
+        self.boost_var = tk.IntVar(value=20)
+        ttk.Entry(controls, textvariable=self.boost_var, width=8).grid(row=2, column=1, sticky=W)
+
         run_btn = ttk.Button(controls, text='Run', bootstyle='success-outline', command=self.run)
-        run_btn.grid(row=2, column=0, columnspan=2, pady=8, sticky=EW)
+        run_btn.grid(row=3, column=0, columnspan=2, pady=8, sticky=EW)
 
         # Process table
         table_frame = ttk.LabelFrame(left, text='Processes (id, arrival, burst, priority)', padding=8)
@@ -290,10 +291,10 @@ class App:
         right = ttk.Frame(root, padding=12)
         right.pack(side=LEFT, fill=BOTH, expand=True)
 
-        self.fig = Figure(figsize=(7,3))
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right)
-        self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        # figure is created on the first Run (matplotlib is prefetched in the background)
+        chart_frame = ttk.Frame(right)
+        chart_frame.pack(fill=BOTH, expand=True)
+        self.chart = LazyChart(chart_frame, figsize=(7,3))
 
         self.results_box = tk.Text(right, height=8, wrap='none')
         self.results_box.pack(fill=X, pady=6)
@@ -336,7 +337,7 @@ class App:
                 priority = int(vals[2]) if len(vals) > 2 else 0
             except Exception:
                 raise ValueError('Arrival, Burst and Priority must be integers')
-            procs.append({'id': iid, 'arrival': arrival, 'burst': burst, 'priority': priority})
+            procs.append(Process(iid, arrival, burst, priority))
         return procs
 
     def run(self):
@@ -359,15 +360,17 @@ class App:
             gantt, results = priority_non_preemptive(procs)
         elif algo == 'Round Robin':
             gantt, results = round_robin(procs, quantum=quantum)
+        elif algo == 'MLFQ':
+            gantt, results = mlfq(procs, quanta=quanta_for(quantum), boost=max(1, self.boost_var.get()))
         else:
             messagebox.showerror('Algorithm error', 'Unknown algorithm')
             return
 
         metrics = compute_metrics(procs, results)
-        self.show_metrics(metrics)
+        self.show_metrics(metrics, metrics_from_schedule(procs, gantt).summary())
         self.draw_gantt(gantt, title=algo)
 
-    def show_metrics(self, metrics):
+    def show_metrics(self, metrics, summary=None):
         self.results_box.delete('1.0', tk.END)
         lines = []
         total_w = 0
@@ -381,36 +384,46 @@ class App:
             total_w += m['waiting']
             total_t += m['turnaround']
             count += 1
-        if count:
+        if summary:
+            # averages plus p50 / p90 / p99 from the streaming sketches
+            lines.extend(format_summary(summary))
+        elif count:
             lines.append(f"Average Waiting = {total_w / count:.2f}")
             lines.append(f"Average Turnaround = {total_t / count:.2f}")
         self.results_box.insert(tk.END, "\n".join(lines))
 
     def draw_gantt(self, gantt, title='Gantt'):
-        self.ax.clear()
+        ax = self.chart.ensure()
+        ax.clear()
         y = 0
         height = 0.6
         colors = {}
-        cmap = self.fig.canvas.get_renderer()  # not used for color but placeholder
 
         # assign a color for each pid
         pids = list({seg[0] for seg in gantt})
         for i, pid in enumerate(pids):
             colors[pid] = f'C{i % 10}'
 
-        for pid, start, finish in gantt:
-            self.ax.barh(0, finish - start, left=start, height=height, align='center', color=colors.get(pid))
-            self.ax.text((start + finish) / 2, 0, pid, va='center', ha='center', color='white', fontsize=9)
+        # one collection for every segment keeps zoom redraws cheap on long schedules
+        self.chart.draw_bars([(pid, y, start, finish) for pid, start, finish in gantt], colors,
+                             height=height, color='white', fontsize=9)
 
-        self.ax.set_ylim(-1, 1)
-        self.ax.set_yticks([])
-        self.ax.set_xlabel('Time')
-        self.ax.set_title(title)
-        self.ax.grid(True, axis='x', linestyle='--', alpha=0.4)
-        self.canvas.draw()
+        ax.set_ylim(-1, 1)
+        ax.set_yticks([])
+        ax.set_xlabel('Time')
+        ax.set_title(title)
+        ax.grid(True, axis='x', linestyle='--', alpha=0.4)
+        # hover tooltips + wheel zoom; the title tracks the visible window's stats
+        index = GanttIndex(gantt)
+        self.chart.set_index(index, on_window=lambda a, b: ax.set_title(f'{title}\n{index.describe_window(a, b)}', fontsize=10))
+        self.chart.canvas.draw()
 
 
 if __name__ == '__main__':
-    root = tb.Window(themename='cosmo')
+    # ttkbootstrap has to be imported before the first ttk widget exists
+    import ttkbootstrap as tb
+    root = tb.Window(themename='cyborg')  # one theme, built once
     app = App(root)
+    root.after_idle(lambda: print(f'ready in {time.perf_counter() - _STARTED:.2f} s', file=sys.stderr))
+    root.after(200, prefetch_chart_modules)
     root.mainloop()
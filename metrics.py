@@ -0,0 +1,184 @@
+"""
+Streaming waiting / turnaround / response metrics.
+
+QuantileSketch is a log-bucketed histogram (DDSketch style): every value v > 0
+lands in bucket ceil(log_gamma(v)), so any quantile is answered within the
+configured relative error using memory proportional to the value range, not
+the number of samples. Sketches with the same accuracy merge by adding bucket
+counts, so runs done in parallel can be combined afterwards. Small inputs are
+kept exactly and only collapsed into buckets once they grow past exact_limit.
+Negative inputs are clamped to 0: waiting and response times cannot be
+negative, so a negative value is float rounding noise.
+"""
+
+import math
+
+from process import as_processes
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class QuantileSketch:
+    __slots__ = ('relative_accuracy', 'exact_limit', '_gamma', '_inv_log_gamma',
+                 '_exact', '_buckets', '_zeros', 'count', 'total', 'min', 'max')
+
+    def __init__(self, relative_accuracy=0.01, exact_limit=1024):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('relative_accuracy must be in (0, 1)')
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inv_log_gamma = 1 / math.log(self._gamma)
+        self._exact = []        # raw values until exact_limit is exceeded, then None
+        self._buckets = {}      # bucket index -> count
+        self._zeros = 0         # values == 0 (e.g. zero waiting time)
+        self.count = 0
+        self.total = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        if value < 0:
+            value = 0           # float noise, see the module docstring
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        exact = self._exact
+        if exact is not None:
+            exact.append(value)
+            if len(exact) > self.exact_limit:
+                self._collapse()
+        else:
+            self._add_bucketed(value, 1)
+
+    def _add_bucketed(self, value, n):
+        if value == 0:
+            self._zeros += n
+        else:
+            i = math.ceil(math.log(value) * self._inv_log_gamma)
+            self._buckets[i] = self._buckets.get(i, 0) + n
+
+    def _collapse(self):
+        exact, self._exact = self._exact, None
+        for v in exact:
+            self._add_bucketed(v, 1)
+
+    def merge(self, other):
+        """Fold `other` into this sketch (both must use the same accuracy)."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('cannot merge sketches with different relative_accuracy')
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if self._exact is not None and other._exact is not None \
+                and len(self._exact) + len(other._exact) <= self.exact_limit:
+            self._exact.extend(other._exact)
+            return self
+        if self._exact is not None:
+            self._collapse()
+        if other._exact is not None:
+            for v in other._exact:
+                self._add_bucketed(v, 1)
+        else:
+            self._zeros += other._zeros
+            buckets = self._buckets
+            for i, n in other._buckets.items():
+                buckets[i] = buckets.get(i, 0) + n
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q):
+        """Nearest-rank q-quantile (0 <= q <= 1), None when empty."""
+        if not self.count:
+            return None
+        rank = max(0, math.ceil(q * self.count) - 1)
+        if self._exact is not None:
+            self._exact.sort()
+            return self._exact[rank]
+        seen = self._zeros
+        if rank < seen:
+            return 0
+        for i in sorted(self._buckets):
+            seen += self._buckets[i]
+            if rank < seen:
+                # midpoint of (gamma^(i-1), gamma^i] in relative terms
+                value = 2 * self._gamma ** i / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class StreamingMetrics:
+    """Per-metric quantile sketches fed one completed process at a time."""
+
+    FIELDS = ('waiting', 'turnaround', 'response')
+
+    def __init__(self, relative_accuracy=0.01):
+        self.sketches = {f: QuantileSketch(relative_accuracy) for f in self.FIELDS}
+
+    def add(self, waiting, turnaround, response):
+        sk = self.sketches
+        sk['waiting'].add(waiting)
+        sk['turnaround'].add(turnaround)
+        sk['response'].add(response)
+
+    def add_completion(self, arrival, burst, first_start, finish):
+        turnaround = finish - arrival
+        self.add(turnaround - burst, turnaround, first_start - arrival)
+
+    def merge(self, other):
+        for f in self.FIELDS:
+            self.sketches[f].merge(other.sketches[f])
+        return self
+
+    @property
+    def count(self):
+        return self.sketches['waiting'].count
+
+    def summary(self, quantiles=QUANTILES):
+        """{field: {'mean': .., 'p50': .., ...}} for every metric."""
+        out = {}
+        for f, sk in self.sketches.items():
+            row = {'mean': sk.mean}
+            for q in quantiles:
+                row[f'p{q * 100:g}'] = sk.quantile(q)
+            out[f] = row
+        return out
+
+
+def metrics_from_schedule(processes, gantt, relative_accuracy=0.01):
+    """Build StreamingMetrics from a (pid, start, finish) Gantt list.
+
+    Response time uses the first segment of each process, turnaround the last.
+    """
+    first = {}
+    last = {}
+    for pid, start, finish in gantt:
+        if pid not in first:
+            first[pid] = start
+        last[pid] = finish
+    m = StreamingMetrics(relative_accuracy)
+    for p in as_processes(processes):
+        if p.id in first:
+            m.add_completion(p.arrival, p.burst, first[p.id], last[p.id])
+    return m
+
+
+def format_summary(summary, fields=StreamingMetrics.FIELDS):
+    """One text line per metric: 'Waiting: avg 2.50  p50 2.00  p90 5.00  p99 7.00'."""
+    lines = []
+    for f in fields:
+        row = summary[f]
+        if row['mean'] is None:
+            continue
+        lines.append(f"{f.capitalize()}: " + '  '.join(f"{'avg' if k == 'mean' else k} {v:.2f}"
+                                                         for k, v in row.items()))
+    return lines
@@ -0,0 +1,130 @@
+"""
+Multi-level feedback queue (MLFQ) scheduler.
+
+- one FIFO deque per level; new arrivals enter level 0 (highest priority)
+- a job that uses up its level's quantum is demoted one level
+- an arrival preempts a job running below level 0; the preempted job goes
+  back to the head of its own level and keeps the quantum it has left
+- every `boost` time units all waiting jobs are moved back to level 0
+- the last level may use quantum None, i.e. run to completion (FCFS)
+
+Time advances from event to event (slice end, next arrival, next boost)
+rather than tick by tick, and dispatch is a popleft from the first
+non-empty level, so a run costs O(segments * levels).
+"""
+
+from collections import deque
+
+from process import as_processes, by_arrival
+
+# leftover slice/burst below this counts as used up (float rounding)
+EPS = 1e-9
+
+
+def quanta_for(base, levels=3):
+    """Doubling quanta per level: (base, 2*base, 4*base, ...)."""
+    return tuple(base * 2 ** k for k in range(levels))
+
+
+def mlfq(processes, quanta=(2, 4, 8), boost=None):
+    """Returns (gantt, results) like the other schedulers in main.py.
+
+    results[pid] = {'start': first dispatch, 'finish': completion}.
+    """
+    quanta = tuple(quanta)
+    if not quanta:
+        raise ValueError('MLFQ needs at least one level')
+    if any(q is not None and q <= 0 for q in quanta):
+        raise ValueError('MLFQ quanta must be > 0')
+    if boost is not None and boost <= 0:
+        raise ValueError('MLFQ boost interval must be > 0')
+
+    procs = sorted(as_processes(processes), key=by_arrival)
+    n = len(procs)
+    bottom = len(quanta) - 1
+    arrival = [p.arrival for p in procs]
+    remaining = [p.burst for p in procs]
+    used = [0] * n          # time consumed against the current level's quantum
+    levels = [deque() for _ in quanta]
+    queued = 0
+    next_boost = boost if boost is not None else float('inf')
+
+    gantt = []
+    results = {}
+    time = 0
+    i = 0
+    while i < n or queued:
+        while i < n and arrival[i] <= time:
+            levels[0].append(i)
+            i += 1
+            queued += 1
+
+        if time >= next_boost:
+            top = levels[0]
+            for lv in range(1, len(levels)):
+                q = levels[lv]
+                for j in q:
+                    used[j] = 0
+                top.extend(q)
+                q.clear()
+            while next_boost <= time:
+                next_boost += boost
+
+        if not queued:
+            time = arrival[i]  # idle until the next arrival
+            continue
+
+        lv = 0
+        while not levels[lv]:
+            lv += 1
+        j = levels[lv].popleft()
+        queued -= 1
+        quantum = quanta[lv]
+
+        # next event: slice end, completion, preempting arrival or boost
+        run = remaining[j] if quantum is None else min(quantum - used[j], remaining[j])
+        end = time + run
+        cut = False
+        if lv > 0 and i < n and arrival[i] < end:
+            end, cut = arrival[i], True
+        if next_boost < end:
+            end, cut = next_boost, True
+
+        pid = procs[j].id
+        if gantt and gantt[-1][0] == pid and gantt[-1][2] == time:
+            gantt[-1] = (pid, gantt[-1][1], end)
+        else:
+            gantt.append((pid, time, end))
+        if pid not in results:
+            results[pid] = {'start': time, 'finish': end}
+
+        # count progress as the planned slice when it ran to its end; float
+        # differences (end - time) can leave a leftover that never drains
+        if cut:
+            ran = end - time
+            remaining[j] -= ran
+            used[j] += ran
+        elif run == remaining[j]:
+            remaining[j] = 0
+        else:
+            remaining[j] -= run
+            used[j] = quantum
+        time = end
+        # arrivals during the slice queue ahead of the job being requeued
+        while i < n and arrival[i] <= time:
+            levels[0].append(i)
+            i += 1
+            queued += 1
+
+        if remaining[j] <= EPS:
+            results[pid]['finish'] = time
+            continue
+        if quantum is not None and quantum - used[j] <= EPS:
+            lv = min(lv + 1, bottom)
+            used[j] = 0
+            levels[lv].append(j)
+        else:
+            levels[lv].appendleft(j)
+        queued += 1
+
+    return gantt, results
@@ -0,0 +1,66 @@
+"""
+Process record shared by the schedulers in app.py and main.py.
+
+Schedulers accept either Process objects or the original dicts
+({'id', 'arrival', 'burst', 'priority'}); dicts are converted once on entry
+by as_processes() so the scheduling loops only do slot attribute reads.
+
+A process may also carry `bursts`, alternating CPU and I/O durations
+(cpu, io, cpu, ..., cpu), for the event-queue simulator in simulator.py.
+`burst` is then the total CPU time; the classic schedulers only look at it.
+"""
+
+import math
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+
+@dataclass(slots=True, frozen=True)
+class Process:
+    id: str
+    arrival: float
+    burst: float
+    priority: int = 0
+    bursts: tuple = None
+    # ready-queue ordering for the priority scheduler, computed once at
+    # construction; the record is frozen so it cannot go stale
+    priority_key: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'priority_key', (self.priority, self.arrival))
+
+    @classmethod
+    def from_dict(cls, d):
+        bursts = d.get('bursts')
+        if bursts is not None:
+            bursts = tuple(bursts)
+            burst = sum(bursts[0::2])
+            # the classic schedulers read burst, the simulator bursts: they must agree
+            if 'burst' in d and not math.isclose(d['burst'], burst):
+                raise ValueError(f"{d['id']}: burst {d['burst']} is not the total CPU time "
+                                 f"{burst} of its bursts")
+        else:
+            burst = d['burst']
+        return cls(d['id'], d['arrival'], burst, d.get('priority', 0), bursts)
+
+    @classmethod
+    def with_bursts(cls, id, arrival, bursts, priority=0):
+        """Process with alternating CPU/I/O bursts; burst = total CPU time."""
+        bursts = tuple(bursts)
+        return cls(id, arrival, sum(bursts[0::2]), priority, bursts)
+
+    def to_dict(self):
+        d = {'id': self.id, 'arrival': self.arrival, 'burst': self.burst, 'priority': self.priority}
+        if self.bursts is not None:
+            d['bursts'] = list(self.bursts)
+        return d
+
+
+by_arrival = attrgetter('arrival')
+by_burst = attrgetter('burst')
+by_priority = attrgetter('priority_key')
+
+
+def as_processes(processes):
+    """Conversion shim for the dict API: returns a list of Process objects."""
+    return [p if isinstance(p, Process) else Process.from_dict(p) for p in processes]
@@ -0,0 +1,346 @@
+"""
+Headless comparison reports: Gantt chart + waiting-time histogram per
+(workload, policy), rendered to PNG/SVG files and assembled into an HTML
+page and a PNG contact sheet.
+
+Charts are rendered with the Agg backend in a process pool. Each worker
+builds one Figure when it starts and reuses it for every chart it draws,
+so the per-chart cost is drawing + encoding only, never Tk or figure set-up
+(see the worker-side notes below for how drawing is kept small).
+
+How to run:
+   python report.py --workloads 100 --n 40 --out report
+"""
+
+import argparse
+import html
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from process import Process, as_processes
+from simulator import POLICIES, simulate
+
+# ---------------- Jobs ---------------- #
+
+
+def chart_jobs(workloads, policies=tuple(POLICIES), quantum=2):
+    """One job per (workload, policy): (name, title, gantt, waiting times).
+
+    `workloads` maps a workload name to its list of processes.
+    """
+    jobs = []
+    for wname, procs in workloads.items():
+        procs = as_processes(procs)
+        for policy in policies:
+            res = simulate(procs, policy, quantum=quantum if policy == 'RR' else None)
+            waiting = [res.results[p.id]['waiting'] for p in procs]
+            jobs.append((f'{wname}-{policy}', f'{wname} / {policy}', res.gantt, waiting))
+    return jobs
+
+
+def random_workloads(count, n, seed=0):
+    rnd = random.Random(seed)
+    return {f'w{k:03d}': [Process(f'P{i}', rnd.randint(0, n * 3), rnd.randint(1, 8), rnd.randint(0, 5))
+                          for i in range(n)]
+            for k in range(count)}
+
+
+# ---------------- Worker side ---------------- #
+#
+# Matplotlib's axis layout (locators, formatters, tick artists, label
+# placement) is most of what a full draw costs. The workers therefore keep
+# the axes themselves tickless: frames and axis labels are drawn once and
+# cached as pixels, and each chart restores that background and draws only
+# its own few artists on top, all in axes coordinates, with tick values from
+# MaxNLocator. Tick labels repeat from chart to chart, so their pixels are
+# kept too and stamped back instead of laying out the text again. SVG has no
+# pixels to reuse, so it draws the same artists with a normal savefig.
+
+_fig = None
+_canvas = None
+_background = None
+_gantt = None
+_hist = None
+_out = None
+_thumb = None
+_PALETTE = None
+_x_locator = None
+_count_locator = None
+_stamps = {}        # (label, ha, va) -> (pixels, dx, dy) of a tick label drawn before
+MAX_ROW_LABELS = 20
+TICK_LABELS = 8     # MaxNLocator(5) never yields more
+THUMB = (240, 160)  # contact sheet cell
+
+
+class _Panel:
+    """A tickless axes plus the artists that stand in for its ticks."""
+
+    def __init__(self, ax, data, y_labels, numeric_y=True):
+        from matplotlib.lines import TICKDOWN, TICKLEFT, Line2D
+        from matplotlib.transforms import offset_copy
+
+        self.ax = ax
+        self.data = data
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.add_artist(data)
+        tick = dict(linestyle='', color='k', markersize=3.5, markeredgewidth=0.8,
+                    transform=ax.transAxes, clip_on=False)
+        self.x_ticks = ax.add_line(Line2D([], [], marker=TICKDOWN, **tick))
+        self.y_ticks = ax.add_line(Line2D([], [], marker=TICKLEFT, **tick))
+        below = offset_copy(ax.transAxes, ax.figure, y=-5, units='points')
+        left = offset_copy(ax.transAxes, ax.figure, x=-5, units='points')
+        self.x_labels = [ax.text(0, 0, '', transform=below, ha='center', va='top', fontsize=7)
+                         for _ in range(TICK_LABELS)]
+        self.y_labels = [ax.text(0, 0, '', transform=left, ha='right', va='center', fontsize=7)
+                         for _ in range(y_labels)]
+        # numbers recur across charts; row names may overlap, so they are never stamped
+        self.stamped = self.x_labels + (self.y_labels if numeric_y else [])
+        self.drawn = [data, self.x_ticks, self.y_ticks, ax.title]
+        if numeric_y:
+            # after the stamps: wide counts can reach the axis label
+            self.drawn.append(ax.yaxis.label)
+        else:
+            self.drawn += self.y_labels
+        self.artists = self.drawn + self.stamped
+
+    def set_x(self, positions, labels):
+        self.x_ticks.set_data(positions, [0] * len(positions))
+        _place(self.x_labels, ((x, 0) for x in positions), labels)
+
+    def set_y(self, positions, labels):
+        self.y_ticks.set_data([0] * len(positions), positions)
+        _place(self.y_labels, ((0, y) for y in positions), labels)
+
+    def draw(self):
+        # labels first: a new stamp must be copied before anything lands next to it
+        for text in self.stamped:
+            if text.get_visible():
+                _stamp(self.ax, text)
+        for artist in self.drawn:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+
+def _stamp(ax, text):
+    # snap the anchor to a whole pixel: a stamp can only move by whole pixels
+    fx, fy = text.get_position()
+    x, y = text.get_transform().transform((fx, fy))
+    text.set_position((fx + (round(x) - x) / ax.bbox.width, fy + (round(y) - y) / ax.bbox.height))
+    x, y = round(x), round(y)
+    y = _canvas.get_width_height()[1] - y   # Agg regions count rows from the top
+    key = (text.get_text(), text.get_ha(), text.get_va())
+    stamp = _stamps.get(key)
+    if stamp is None:
+        ax.draw_artist(text)
+        box = text.get_window_extent().padded(2)
+        if _fig.bbox.contains(*box.p0) and _fig.bbox.contains(*box.p1):
+            # a label cut off by the figure edge is not reusable elsewhere
+            pixels = _canvas.copy_from_bbox(box)
+            x1, y1, _, _ = pixels.get_extents()
+            _stamps[key] = (pixels, x1 - x, y1 - y)
+    else:
+        pixels, dx, dy = stamp
+        _canvas.restore_region(pixels, xy=(x + dx, y + dy))
+
+
+def _place(texts, positions, labels):
+    k = 0
+    for text, xy, label in zip(texts, positions, labels):
+        text.set_position(xy)
+        text.set_text(label)
+        text.set_visible(True)
+        k += 1
+    for text in texts[k:]:
+        text.set_visible(False)
+
+
+def _ticks(lo, hi, locator):
+    """Nice tick values inside [lo, hi] as (axes fractions, labels)."""
+    span = (hi - lo) or 1
+    values = [v for v in locator.tick_values(lo, hi) if lo <= v <= hi]
+    return [(v - lo) / span for v in values], [f'{v:g}' for v in values]
+
+
+def _init_worker(out_dir, fmt, figsize, dpi, thumb):
+    global _fig, _canvas, _background, _gantt, _hist, _out, _thumb, _PALETTE, _x_locator, _count_locator
+    from matplotlib import rcParams
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import PolyCollection
+    from matplotlib.figure import Figure
+    from matplotlib.patches import StepPatch
+    from matplotlib.ticker import MaxNLocator
+
+    _fig = Figure(figsize=figsize, dpi=dpi)
+    _canvas = FigureCanvasAgg(_fig)
+    gantt_ax, hist_ax = _fig.subplots(2, 1, gridspec_kw={'height_ratios': (3, 2)})
+    _fig.subplots_adjust(left=0.08, right=0.98, top=0.92, bottom=0.1, hspace=0.4)
+    gantt_ax.set_xlabel('Time', fontsize=8, labelpad=15)
+    hist_ax.set_xlabel('Waiting time', fontsize=8, labelpad=15)
+    hist_ax.set_ylabel('Processes', fontsize=8, labelpad=18)
+    _gantt = _Panel(gantt_ax, PolyCollection([], linewidths=0), MAX_ROW_LABELS, numeric_y=False)
+    _hist = _Panel(hist_ax, StepPatch([0], [0, 1], fill=True, color='C0'), TICK_LABELS)
+    _x_locator = MaxNLocator(5)
+    _count_locator = MaxNLocator(4, integer=True)
+    _PALETTE = rcParams['axes.prop_cycle'].by_key()['color']
+    _out = out_dir
+    _thumb = thumb
+    if fmt == 'png':
+        # keep the chart artists out of the cached background; _render blits them
+        for artist in _gantt.artists + _hist.artists:
+            artist.set_animated(True)
+        # an axis draws its label whether animated or not
+        hist_ax.yaxis.label.set_visible(False)
+        _canvas.draw()
+        hist_ax.yaxis.label.set_visible(True)
+        _background = _canvas.copy_from_bbox(_fig.bbox)
+
+
+def _render(job, fmt):
+    # already loaded by the initializer's matplotlib import; this is a dict lookup
+    import numpy as np
+
+    name, title, gantt, waiting = job
+    panel = _gantt
+    lo = min((s for _, s, _ in gantt), default=0)
+    hi = max((f for _, _, f in gantt), default=1)
+    span = (hi - lo) or 1
+    rows = {}
+    for pid, _, _ in gantt:
+        rows.setdefault(pid, len(rows))
+    n = len(rows) or 1
+    # row 0 at the top, each bar 80% of its row
+    verts = []
+    colors = []
+    for pid, start, finish in gantt:
+        y = rows[pid]
+        top, bottom = 1 - (y + 0.1) / n, 1 - (y + 0.9) / n
+        a, b = (start - lo) / span, (finish - lo) / span
+        verts.append(((a, bottom), (a, top), (b, top), (b, bottom)))
+        colors.append(_PALETTE[y % len(_PALETTE)])
+    panel.data.set_verts(verts)
+    panel.data.set_facecolor(colors)
+    panel.set_x(*_ticks(lo, hi, _x_locator))
+    if len(rows) <= MAX_ROW_LABELS:
+        panel.set_y([1 - (y + 0.5) / n for y in rows.values()], list(rows))
+    else:
+        panel.set_y([], [])
+    panel.ax.set_title(title, fontsize=10)
+
+    panel = _hist
+    counts, edges = np.histogram(waiting, bins=20)
+    top = max(counts.max(), 1) * 1.05
+    wide = (edges[-1] - edges[0]) or 1
+    panel.data.set_data(counts / top, (edges - edges[0]) / wide)
+    panel.set_x(*_ticks(edges[0], edges[-1], _x_locator))
+    panel.set_y(*_ticks(0, top, _count_locator))
+
+    path = os.path.join(_out, f'{name}.{fmt}')
+    if fmt != 'png':
+        _fig.savefig(path, format=fmt)
+        return path, None
+    from PIL import Image
+
+    _canvas.restore_region(_background)
+    _gantt.draw()
+    _hist.draw()
+    image = Image.frombuffer('RGBA', _canvas.get_width_height(), _canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+    image = image.convert('RGB')
+    # opaque RGB at a fast zlib level: encoding is now the largest share of a chart
+    image.save(path, compress_level=1)
+    if _thumb is None:
+        return path, None
+    # shrink while the pixels are here instead of decoding the PNG again;
+    # reducing_gap lets PIL halve the image first, which is ~10x cheaper
+    image.thumbnail(_thumb, reducing_gap=1.0)
+    return path, image
+
+
+def _render_chunk(args):
+    jobs, fmt = args
+    return [_render(job, fmt) for job in jobs]
+
+
+# ---------------- Report ---------------- #
+
+def render_charts(jobs, out_dir, fmt='png', workers=None, figsize=(6, 4), dpi=80, thumb=None):
+    """Render every job to out_dir/<name>.<fmt> in a process pool.
+
+    Returns a (path, thumbnail) pair per job. With thumb=(w, h) and PNG output
+    the workers also shrink every chart to fit that size; otherwise thumbnail
+    is None.
+    """
+    if fmt not in ('png', 'svg'):
+        raise ValueError("fmt must be 'png' or 'svg'")
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    # a few chunks per worker keeps the pool busy without per-job IPC
+    size = max(1, len(jobs) // (workers * 4))
+    chunks = [(jobs[k:k + size], fmt) for k in range(0, len(jobs), size)]
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(out_dir, fmt, figsize, dpi, thumb)) as pool:
+        return [pair for pairs in pool.map(_render_chunk, chunks) for pair in pairs]
+
+
+def write_html(paths, titles, out_dir, columns):
+    rows = []
+    for k in range(0, len(paths), columns):
+        cells = ''.join(
+            f'<td><a href="{html.escape(os.path.basename(p))}"><img src="{html.escape(os.path.basename(p))}" '
+            f'width="320" title="{html.escape(t)}"></a></td>'
+            for p, t in zip(paths[k:k + columns], titles[k:k + columns]))
+        rows.append(f'<tr>{cells}</tr>')
+    index = os.path.join(out_dir, 'index.html')
+    with open(index, 'w') as f:
+        f.write('<!doctype html><meta charset="utf-8"><title>Scheduling report</title>\n'
+                '<table>\n' + '\n'.join(rows) + '\n</table>\n')
+    return index
+
+
+def write_contact_sheet(thumbnails, out_dir, columns, thumb=THUMB):
+    """Tile chart thumbnails (from render_charts) into one contact_sheet.png."""
+    from PIL import Image
+
+    rows = (len(thumbnails) + columns - 1) // columns
+    sheet = Image.new('RGB', (columns * thumb[0], rows * thumb[1]), 'white')
+    for k, im in enumerate(thumbnails):
+        sheet.paste(im, ((k % columns) * thumb[0], (k // columns) * thumb[1]))
+    out = os.path.join(out_dir, 'contact_sheet.png')
+    sheet.save(out, compress_level=1)
+    return out
+
+
+def build_report(workloads, out_dir, policies=tuple(POLICIES), fmt='png', workers=None, quantum=2):
+    """Charts for every (workload, policy) plus index.html (and contact_sheet.png for PNG)."""
+    jobs = chart_jobs(workloads, policies, quantum)
+    rendered = render_charts(jobs, out_dir, fmt, workers, thumb=THUMB if fmt == 'png' else None)
+    paths = [path for path, _ in rendered]
+    columns = len(policies)  # one row per workload, one column per policy
+    outputs = {'charts': paths, 'html': write_html(paths, [job[1] for job in jobs], out_dir, columns)}
+    if fmt == 'png':
+        outputs['contact_sheet'] = write_contact_sheet([im for _, im in rendered], out_dir, columns)
+    return outputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render a policy comparison report.')
+    parser.add_argument('--workloads', type=int, default=100, help='number of random workloads')
+    parser.add_argument('--n', type=int, default=40, help='processes per workload')
+    parser.add_argument('--out', default='report')
+    parser.add_argument('--format', choices=('png', 'svg'), default='png')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--quantum', type=float, default=2)
+    args = parser.parse_args(argv)
+
+    t = time.perf_counter()
+    out = build_report(random_workloads(args.workloads, args.n), args.out,
+                       fmt=args.format, workers=args.workers, quantum=args.quantum)
+    print(f"{len(out['charts'])} charts in {time.perf_counter() - t:.1f} s -> {out['html']}")
+
+
+if __name__ == '__main__':
+    main()
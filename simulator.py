@@ -0,0 +1,251 @@
+"""
+Event-queue simulator for processes with alternating CPU / I/O bursts.
+
+Everything that can happen is an event on one global heap, ordered by time
+and then by kind so that simultaneous arrivals and I/O returns reach the ready
+queue before a job coming off the CPU is requeued:
+
+    ARRIVAL    a process enters the ready queue with its first CPU burst
+    IO_DONE    an I/O burst ended; the next CPU burst becomes ready
+    CPU_DONE   the running CPU burst finished (the job starts I/O or exits)
+    QUANTUM    the running job used up its time slice (RR)
+
+Only the next arrival is kept on the heap (the following one is pushed when it
+fires), so the heap holds at most one event per process in I/O plus two.
+The scheduling policy is just the ready queue: FCFS, SJF, SRTF, Priority and
+RR each provide push/pop (and, for SRTF, preemption) on process indices.
+"""
+
+import heapq
+from collections import deque
+
+from metrics import StreamingMetrics
+from process import as_processes, by_arrival
+
+ARRIVAL, IO_DONE, CPU_DONE, QUANTUM = range(4)
+
+
+# ---------------- Ready queues (policies) ---------------- #
+
+class FifoQueue:
+    """FCFS, and RR when the simulator is given a quantum."""
+    preemptive = False
+
+    def __init__(self, sim):
+        self._q = deque()
+
+    def __len__(self):
+        return len(self._q)
+
+    def push(self, j):
+        self._q.append(j)
+
+    def pop(self):
+        return self._q.popleft()
+
+
+class KeyedQueue:
+    """Min-heap on key(j); ties keep ready order."""
+    preemptive = False
+
+    def __init__(self, key):
+        self.key = key
+        self._heap = []
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, j):
+        self._seq += 1
+        heapq.heappush(self._heap, (self.key(j), self._seq, j))
+
+    def pop(self):
+        return heapq.heappop(self._heap)[2]
+
+    def peek_key(self):
+        return self._heap[0][0]
+
+
+class ShortestBurstQueue(KeyedQueue):
+    """SJF: shortest next CPU burst first."""
+
+    def __init__(self, sim):
+        super().__init__(sim.remaining.__getitem__)
+
+
+class ShortestRemainingQueue(ShortestBurstQueue):
+    """SRTF: like SJF, but a ready job with less CPU left preempts the running one."""
+    preemptive = True
+
+
+class PriorityQueue(KeyedQueue):
+    """Non-preemptive priority: lower number first, then earlier arrival."""
+
+    def __init__(self, sim):
+        procs = sim.procs
+        super().__init__(lambda j: procs[j].priority_key)
+
+
+POLICIES = {
+    'FCFS': FifoQueue,
+    'SJF': ShortestBurstQueue,
+    'SRTF': ShortestRemainingQueue,
+    'Priority': PriorityQueue,
+    'RR': FifoQueue,
+}
+
+
+# ---------------- Simulator ---------------- #
+
+class SimulationResult:
+    __slots__ = ('gantt', 'results', 'metrics', 'busy', 'start', 'end', 'completed')
+
+    def __init__(self, gantt, results, metrics, busy, start, end, completed):
+        self.gantt = gantt
+        self.results = results
+        self.metrics = metrics
+        self.busy = busy
+        self.start = start
+        self.end = end
+        self.completed = completed
+
+    @property
+    def utilization(self):
+        span = self.end - self.start
+        return self.busy / span if span > 0 else 0
+
+    @property
+    def throughput(self):
+        """Completed processes per time unit."""
+        span = self.end - self.start
+        return self.completed / span if span > 0 else 0
+
+
+class Simulator:
+    def __init__(self, processes, policy='FCFS', quantum=None):
+        if policy not in POLICIES:
+            raise ValueError(f'unknown policy {policy!r}; expected one of {", ".join(POLICIES)}')
+        if policy == 'RR' and quantum is None:
+            quantum = 2
+        if quantum is not None and quantum <= 0:
+            raise ValueError('quantum must be > 0')
+        self.procs = sorted(as_processes(processes), key=by_arrival)
+        self.bursts = []
+        for p in self.procs:
+            bursts = p.bursts if p.bursts is not None else (p.burst,)
+            if len(bursts) % 2 == 0:
+                raise ValueError(f'{p.id}: bursts must alternate CPU/I/O and end with a CPU burst')
+            self.bursts.append(bursts)
+        self.remaining = [b[0] for b in self.bursts]   # CPU left in the current burst
+        self.quantum = quantum
+        self.ready = POLICIES[policy](self)
+
+    def run(self, record=True, relative_accuracy=0.01):
+        """Simulate to completion.
+
+        results[pid] holds 'start', 'finish' and 'waiting' (time spent in the
+        ready queue, the same value fed to the metrics). With record=False no
+        Gantt chart or per-process results are kept, only the streaming
+        metrics and utilization totals.
+        """
+        procs, bursts, remaining = self.procs, self.bursts, self.remaining
+        ready, quantum = self.ready, self.quantum
+        n = len(procs)
+        remaining[:] = [b[0] for b in bursts]   # in place: the ready queue may hold a reference
+        stage = [0] * n                 # index into bursts[j]
+        first_start = [None] * n
+        metrics = StreamingMetrics(relative_accuracy)
+        gantt = [] if record else None
+        results = {} if record else None
+
+        def add_segment(j, start, finish):
+            pid = procs[j].id
+            if gantt and gantt[-1][0] == pid and gantt[-1][2] == start:
+                gantt[-1] = (pid, gantt[-1][1], finish)
+            else:
+                gantt.append((pid, start, finish))
+
+        events = []
+        seq = 0                         # FIFO among same-time, same-kind events
+        token = 0                       # bumps on every dispatch; stale CPU events are skipped
+        if n:
+            heapq.heappush(events, (procs[0].arrival, ARRIVAL, seq, 0, 0))
+        running = None
+        run_start = 0
+        busy = 0
+        completed = 0
+        now = procs[0].arrival if n else 0
+
+        while events:
+            now, kind, _, j, tok = heapq.heappop(events)
+
+            if kind == ARRIVAL:
+                ready.push(j)
+                if j + 1 < n:
+                    seq += 1
+                    heapq.heappush(events, (procs[j + 1].arrival, ARRIVAL, seq, j + 1, 0))
+            elif kind == IO_DONE:
+                stage[j] += 1
+                remaining[j] = bursts[j][stage[j]]
+                ready.push(j)
+            elif tok == token:
+                # CPU_DONE or QUANTUM for the job that is still on the CPU
+                ran = now - run_start
+                busy += ran
+                remaining[j] -= ran
+                running = None
+                if record:
+                    add_segment(j, run_start, now)
+                if kind == QUANTUM:
+                    ready.push(j)
+                elif stage[j] + 1 < len(bursts[j]):
+                    stage[j] += 1
+                    seq += 1
+                    heapq.heappush(events, (now + bursts[j][stage[j]], IO_DONE, seq, j, 0))
+                else:
+                    p = procs[j]
+                    turnaround = now - p.arrival
+                    # waiting = time spent in the ready queue
+                    waiting = turnaround - sum(bursts[j])
+                    metrics.add(waiting, turnaround, first_start[j] - p.arrival)
+                    completed += 1
+                    if record:
+                        results[p.id] = {'start': first_start[j], 'finish': now, 'waiting': waiting}
+
+            # let every event at this instant land before choosing who runs
+            if events and events[0][0] == now:
+                continue
+
+            if running is not None and ready.preemptive and ready:
+                left = remaining[running] - (now - run_start)
+                if ready.peek_key() < left:
+                    ran = now - run_start
+                    busy += ran
+                    remaining[running] = left
+                    if record:
+                        add_segment(running, run_start, now)
+                    ready.push(running)
+                    running = None
+
+            if running is None and ready:
+                j = ready.pop()
+                running = j
+                run_start = now
+                if first_start[j] is None:
+                    first_start[j] = now
+                token += 1
+                seq += 1
+                rem = remaining[j]
+                if quantum is not None and quantum < rem:
+                    heapq.heappush(events, (now + quantum, QUANTUM, seq, j, token))
+                else:
+                    heapq.heappush(events, (now + rem, CPU_DONE, seq, j, token))
+
+        start = procs[0].arrival if n else 0
+        return SimulationResult(gantt, results, metrics, busy, start, now, completed)
+
+
+def simulate(processes, policy='FCFS', quantum=None, record=True):
+    """Run `processes` under `policy` ('FCFS', 'SJF', 'SRTF', 'Priority', 'RR')."""
+    return Simulator(processes, policy, quantum).run(record=record)
@@ -0,0 +1,4 @@
+def random_processes(rnd, count):
+    """`count` single-burst process dicts with small integer times."""
+    return [{'id': f'P{i}', 'arrival': rnd.randint(0, 20), 'burst': rnd.randint(1, 9),
+             'priority': rnd.randint(0, 3)} for i in range(count)]
@@ -0,0 +1,42 @@
+import random
+
+from gantt_index import GanttIndex
+
+
+def random_gantt(rnd, count):
+    gantt = []
+    t = rnd.randint(0, 3)
+    for _ in range(count):
+        t += rnd.choice((0, 0, rnd.randint(1, 4)))   # adjacent runs and idle gaps
+        length = rnd.randint(1, 6)
+        gantt.append((f'P{rnd.randint(0, 4)}', t, t + length))
+        t += length
+    rnd.shuffle(gantt)   # the index sorts its input
+    return gantt
+
+
+def overlap(start, finish, a, b):
+    return max(0, min(finish, b) - max(start, a))
+
+
+def test_queries_match_a_linear_scan():
+    rnd = random.Random(7)
+    for _ in range(300):
+        gantt = random_gantt(rnd, rnd.randint(0, 25))
+        index = GanttIndex(gantt)
+        end = max((f for _, _, f in gantt), default=0) + 3
+        for _ in range(20):
+            t = rnd.choice((rnd.randint(-1, end), rnd.uniform(-1, end)))
+            running = [seg for seg in gantt if seg[1] <= t < seg[2]]
+            assert index.at(t) == (running[0] if running else None)
+
+            a = rnd.choice((rnd.randint(-2, end), rnd.uniform(-2, end)))
+            b = a + rnd.choice((0, rnd.randint(1, 10), rnd.uniform(0, 10)))
+            expected = sorted((seg for seg in gantt if seg[2] > a and seg[1] < b), key=lambda seg: seg[1])
+            assert index.window(a, b) == expected
+            busy = sum(overlap(s, f, a, b) for _, s, f in gantt)
+            assert abs(index.busy(a, b) - busy) < 1e-9
+            for pid in ('P0', 'P3', 'missing'):
+                share = sum(overlap(s, f, a, b) for p, s, f in gantt if p == pid)
+                assert abs(index.share(pid, a, b) - share) < 1e-9
+            assert set(index.shares(a, b)) == {p for p, s, f in gantt if overlap(s, f, a, b) > 0}
@@ -0,0 +1,79 @@
+import math
+import random
+
+from metrics import QuantileSketch
+
+QS = (0, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1)
+
+
+def sketch(values, exact_limit=64):
+    sk = QuantileSketch(0.01, exact_limit)
+    for v in values:
+        sk.add(v)
+    return sk
+
+
+def assert_close(sk, values):
+    ordered = sorted(max(v, 0) for v in values)
+    assert sk.count == len(ordered)
+    for q in QS:
+        expected = ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+        got = sk.quantile(q)
+        assert abs(got - expected) <= sk.relative_accuracy * expected + 1e-12, (q, got, expected)
+
+
+def random_values(rnd, n):
+    return [rnd.choice((0, rnd.randint(1, 50), rnd.uniform(0, 1000))) for _ in range(n)]
+
+
+def test_exact_and_bucketed_quantiles():
+    rnd = random.Random(1)
+    for n in (1, 10, 64, 65, 500):
+        values = random_values(rnd, n)
+        assert_close(sketch(values), values)
+
+
+def test_negative_noise_counts_as_zero():
+    values = [0, 0, 0, 5, -1, 10]
+    sk = sketch(values, exact_limit=2)
+    assert sk.quantile(0.5) == 0
+    assert sk.min == 0
+    assert_close(sk, values)
+
+
+def test_merge_exact_into_exact_under_limit():
+    rnd = random.Random(2)
+    a, b = random_values(rnd, 30), random_values(rnd, 30)
+    merged = sketch(a).merge(sketch(b))
+    assert merged._exact is not None
+    assert_close(merged, a + b)
+
+
+def test_merge_exact_into_exact_over_limit():
+    rnd = random.Random(3)
+    a, b = random_values(rnd, 40), random_values(rnd, 40)
+    merged = sketch(a).merge(sketch(b))
+    assert merged._exact is None
+    assert_close(merged, a + b)
+
+
+def test_merge_bucketed_into_exact():
+    rnd = random.Random(4)
+    a, b = random_values(rnd, 20), random_values(rnd, 300)
+    merged = sketch(a).merge(sketch(b))
+    assert_close(merged, a + b)
+
+
+def test_merge_exact_into_bucketed():
+    rnd = random.Random(5)
+    a, b = random_values(rnd, 300), random_values(rnd, 20)
+    merged = sketch(a).merge(sketch(b))
+    assert_close(merged, a + b)
+
+
+def test_merge_bucketed_into_bucketed():
+    rnd = random.Random(6)
+    a, b = random_values(rnd, 300), random_values(rnd, 300)
+    merged = sketch(a).merge(sketch(b))
+    assert math.isclose(merged.total, sum(a) + sum(b))
+    assert_close(merged, a + b)
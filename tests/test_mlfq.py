@@ -0,0 +1,46 @@
+import random
+
+import app
+import main
+from mlfq import mlfq, quanta_for
+from process import Process
+from tests import random_processes
+
+
+def test_single_level_is_round_robin():
+    rnd = random.Random(1)
+    for _ in range(200):
+        procs = random_processes(rnd, rnd.randint(1, 10))
+        q = rnd.randint(1, 4)
+        assert mlfq(procs, (q,)) == main.round_robin(procs, q)
+
+
+def test_unbounded_single_level_is_fcfs():
+    rnd = random.Random(2)
+    for _ in range(200):
+        procs = random_processes(rnd, rnd.randint(1, 10))
+        assert mlfq(procs, (None,)) == main.fcfs(procs)
+
+
+def test_readme_example():
+    procs = [Process('P1', 0, 10), Process('P2', 3, 2)]
+    gantt, results = mlfq(procs, (2, 4, 8))
+    assert gantt == [('P1', 0, 3), ('P2', 3, 5), ('P1', 5, 12)]
+    assert results == {'P1': {'start': 0, 'finish': 12}, 'P2': {'start': 3, 'finish': 5}}
+
+
+def test_boost_moves_jobs_back_to_top_level():
+    procs = [Process('A', 0, 6), Process('B', 0, 6)]
+    assert mlfq(procs, (1, 10))[0] == [('A', 0, 1), ('B', 1, 2), ('A', 2, 7), ('B', 7, 12)]
+    # at t=4 both jobs return to level 0 and get a 1-unit slice each again
+    assert mlfq(procs, (1, 10), boost=4)[0] == [
+        ('A', 0, 1), ('B', 1, 2), ('A', 2, 5), ('B', 5, 6), ('A', 6, 8), ('B', 8, 12)]
+
+
+def test_fractional_quanta_terminate():
+    # float rounding used to leave a ~1e-14 slice that never advanced time
+    gantt, stats = app.mlfq([Process('P1', 1.0, 8.3), Process('P2', 1.9, 6.0)], quanta_for(0.1), 20.0)
+    assert abs(stats['P1']['turnaround'] - 14.3) < 1e-9
+    assert abs(stats['P2']['turnaround'] - 11.8) < 1e-9
+    busy = sum(f - s for _, s, f in gantt)
+    assert abs(busy - 14.3) < 1e-9
@@ -0,0 +1,21 @@
+import report
+
+
+def test_stamped_tick_labels_match_a_fresh_draw(tmp_path):
+    from PIL import Image, ImageChops
+
+    workloads = report.random_workloads(4, 12)
+    workloads.update({f'big{k}': procs for k, procs in report.random_workloads(1, 300, seed=1).items()})
+    jobs = report.chart_jobs(workloads)
+    warm, fresh = tmp_path / 'warm', tmp_path / 'fresh'
+    warm.mkdir()
+    fresh.mkdir()
+    report._init_worker(str(warm), 'png', (6, 4), 80, None)
+    for job in jobs:
+        report._render(job, 'png')
+    report._out = str(fresh)
+    for job in jobs:
+        report._stamps.clear()   # every label laid out from scratch
+        report._render(job, 'png')
+        with Image.open(warm / f'{job[0]}.png') as a, Image.open(fresh / f'{job[0]}.png') as b:
+            assert ImageChops.difference(a, b).getbbox() is None, job[0]
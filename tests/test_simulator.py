@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+import app
+import main
+from process import Process
+from simulator import simulate
+from tests import random_processes
+
+
+def test_single_burst_policies_match_main():
+    rnd = random.Random(7)
+    for _ in range(200):
+        procs = random_processes(rnd, rnd.randint(1, 10))
+        q = rnd.randint(1, 4)
+        for policy, expected in (('FCFS', main.fcfs(procs)),
+                                 ('SJF', main.sjf_non_preemptive(procs)),
+                                 ('Priority', main.priority_non_preemptive(procs)),
+                                 ('RR', main.round_robin(procs, q))):
+            res = simulate(procs, policy, quantum=q if policy == 'RR' else None)
+            assert res.gantt == expected[0], policy
+
+
+def test_srtf_total_waiting_matches_app():
+    rnd = random.Random(8)
+    for _ in range(200):
+        procs = random_processes(rnd, rnd.randint(1, 10))
+        _, stats = app.srtf_preemptive(procs)
+        res = simulate(procs, 'SRTF')
+        assert res.metrics.sketches['waiting'].total == sum(s['waiting'] for s in stats.values())
+        assert sum(r['waiting'] for r in res.results.values()) == res.metrics.sketches['waiting'].total
+
+
+def test_io_bursts_readme_example():
+    procs = [Process.with_bursts('P1', 0, [3, 5, 2]), Process.with_bursts('P2', 1, [4])]
+    res = simulate(procs, 'RR', quantum=2)
+    assert res.gantt == [('P1', 0, 2), ('P2', 2, 4), ('P1', 4, 5), ('P2', 5, 7), ('P1', 10, 12)]
+    assert res.results == {'P2': {'start': 2, 'finish': 7, 'waiting': 2},
+                           'P1': {'start': 0, 'finish': 12, 'waiting': 2}}
+    assert res.utilization == 0.75
+    assert abs(res.throughput - 2 / 12) < 1e-12
+
+
+def test_dict_burst_must_match_bursts():
+    d = {'id': 'P1', 'arrival': 0, 'bursts': [2, 5, 3]}
+    assert Process.from_dict(d).burst == 5
+    assert Process.from_dict(dict(d, burst=5)).burst == 5
+    with pytest.raises(ValueError):
+        Process.from_dict(dict(d, burst=2))